@@ -1,12 +1,43 @@
+import argparse
+import atexit
+import io
+from array import array
+from bisect import bisect_right, insort
+from collections import defaultdict
 import json
+from operator import itemgetter
 import os
+import queue
 import re
+import sys
+import threading
+import unicodedata
 from tabulate import tabulate
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding straight to bytes
+except ImportError:
+    orjson = None
+
+try:
+    from wcwidth import wcswidth  # Optional: more complete terminal width tables
+except ImportError:
+    wcswidth = None
 
 # Directory to store task files
 DATA_FOLDER = "data"
-TODO_FILE = os.path.join(DATA_FOLDER, "tasks.json")
+TODO_FILE = os.path.join(DATA_FOLDER, "tasks.jsonl")
+
+# Input validation patterns, compiled once
+TASKNAME_PATTERN = re.compile(r"^[A-Za-z0-9 ]{1,20}\Z")
+DESCRIPTION_PATTERN = re.compile(r"[A-Za-z0-9]")
+
+# Status names indexed by status code (PENDING, IN_PROGRESS, COMPLETED)
+STATUS_NAMES = ("Pending", "In Progress", "Completed")
+
+# Pulls a task dict's fields in TaskTable column order with a single call
+TASK_FIELDS = itemgetter("taskid", "taskname", "description", "status")
 
 
 @dataclass(frozen=True)
@@ -17,39 +48,520 @@ class TaskStatus:
 
     @staticmethod
     def get_status_name(code: int) -> str:
-        status_map = {
-            None: "Not Assigned",  # If the status is None, show "Not Assigned"
-            TaskStatus.PENDING: "Pending",
-            TaskStatus.IN_PROGRESS: "In Progress",
-            TaskStatus.COMPLETED: "Completed"
+        if code is None:
+            return "Not Assigned"  # If the status is None, show "Not Assigned"
+        if isinstance(code, int) and 0 <= code < len(STATUS_NAMES):
+            return STATUS_NAMES[code]
+        return "Unknown Status"
+
+
+
+@dataclass
+class TaskTable:
+    # Tasks stored column-wise; row i of every column is the same task
+    ids: list = field(default_factory=list)
+    names: list = field(default_factory=list)
+    descs: list = field(default_factory=list)
+    statuses: list = field(default_factory=list)
+    id_to_index: dict = field(default_factory=dict)
+    # Group key -> row indices in ascending (insertion) order
+    status_to_indices: defaultdict = field(default_factory=lambda: defaultdict(list))
+    name_to_indices: defaultdict = field(default_factory=lambda: defaultdict(list))
+
+    @classmethod
+    def from_dicts(cls, tasks):
+        table = cls()
+        for fields in map(TASK_FIELDS, tasks):
+            table.append(*fields)
+        return table
+
+    def __len__(self):
+        return len(self.ids)
+
+    def append(self, task_id, taskname, description, status=None):
+        index = len(self.ids)
+        self.ids.append(task_id)
+        self.names.append(taskname)
+        self.descs.append(description)
+        self.statuses.append(status)
+        self.id_to_index[task_id] = index
+        self.status_to_indices[status].append(index)
+        self.name_to_indices[taskname].append(index)
+        return index
+
+    def find(self, task_id):
+        return self.id_to_index.get(task_id)
+
+    def row(self, index):
+        return {
+            "taskid": self.ids[index],
+            "taskname": self.names[index],
+            "description": self.descs[index],
+            "status": self.statuses[index]
         }
-        return status_map.get(code, "Unknown Status")
 
+    def set_name(self, index, taskname):
+        self._regroup(self.name_to_indices, self.names[index], taskname, index)
+        self.names[index] = taskname
+
+    def set_description(self, index, description):
+        self.descs[index] = description
+
+    def set_status(self, index, status):
+        self._regroup(self.status_to_indices, self.statuses[index], status, index)
+        self.statuses[index] = status
+
+    def remove(self, index):
+        del self.id_to_index[self.ids[index]]
+        for groups, key in ((self.status_to_indices, self.statuses[index]), (self.name_to_indices, self.names[index])):
+            groups[key].remove(index)
+            if not groups[key]:
+                del groups[key]
+        for column in (self.ids, self.names, self.descs, self.statuses):
+            del column[index]
+
+        # Rows after the removed one shift down by one
+        for task_id in self.ids[index:]:
+            self.id_to_index[task_id] -= 1
+        for groups in (self.status_to_indices, self.name_to_indices):
+            for bucket in groups.values():
+                for i in range(bisect_right(bucket, index), len(bucket)):
+                    bucket[i] -= 1
+
+    @staticmethod
+    def groups(groups):
+        # Order groups by their first row, matching a single pass over the rows
+        return sorted(groups.items(), key=lambda item: item[1][0])
+
+    @staticmethod
+    def _regroup(groups, old_key, new_key, index):
+        bucket = groups[old_key]
+        bucket.remove(index)
+        if not bucket:
+            del groups[old_key]
+        insort(groups[new_key], index)
+
+
+class BackgroundWriter:
+    # Writes log appends and status bytes on a daemon thread so saving never blocks the menu.
+    # Everything queued for a file when the thread wakes goes out in one write.
+    def __init__(self, on_idle):
+        self._queue = queue.Queue()
+        self._error = None
+        # Held while submitting, and while on_idle runs after the last queued write lands
+        self.lock = threading.Lock()
+        self._on_idle = on_idle
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, filename, data):
+        self._queue.put((filename, data, None))
+
+    def submit_statuses(self, filename, updates):
+        self._queue.put((filename, None, updates))
+
+    def drain(self):
+        # Block until every submitted write has reached the file
+        self._queue.join()
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            appends = {}
+            status_updates = {}
+            for filename, data, updates in batch:
+                if data is not None:
+                    appends.setdefault(filename, []).append(data)
+                if updates is not None:
+                    status_updates.setdefault(filename, []).extend(updates)
+            try:
+                # Status bytes go first, as in FileHandler.append_records: a new task reusing a
+                # deleted task's ID must never reach the log while the old status byte remains
+                for filename, updates in status_updates.items():
+                    FileHandler._write_statuses(filename, updates)
+                for filename, chunks in appends.items():
+                    data = FileHandler._terminate_tail(filename, b"".join(chunks))
+                    fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    try:
+                        while data:
+                            data = data[os.write(fd, data):]
+                    finally:
+                        os.close(fd)
+            except OSError as e:
+                self._error = e
+            finally:
+                with self.lock:
+                    if self._queue.unfinished_tasks == len(batch):
+                        self._on_idle()
+                for _ in batch:
+                    self._queue.task_done()
 
 
 class FileHandler:
+    # filename -> (file signature, {taskid: task}, record count) for the last load or write of that file
+    _cache = {}
+    # Rewrite the log once it holds this many records per live task
+    COMPACT_RATIO = 2
+    BUFFER_SIZE = 64 * 1024
+    # Space out keys and values on disk for humans (set by --pretty)
+    pretty = False
+    # Key sets of the two record shapes the log holds (see _encode)
+    _TASK_KEYS = {"taskid", "taskname", "description", "rev"}
+    _TOMBSTONE_KEYS = {"taskid", "deleted", "rev"}
+    # Byte stored in the status file for tasks with no status assigned
+    NO_STATUS = -1
+    # Set by enable_async_writes(); None means appends are written inline
+    _writer = None
+
+    @staticmethod
+    def enable_async_writes():
+        if FileHandler._writer is None:
+            FileHandler._writer = BackgroundWriter(on_idle=FileHandler._refresh_signatures)
+            atexit.register(FileHandler._writer.drain)
+
+    @staticmethod
+    def _refresh_signatures():
+        # Called on the writer thread once the queue is empty, so the cache resumes
+        # detecting outside changes from the point our own writes finished
+        for filename, (signature, tasks, records) in list(FileHandler._cache.items()):
+            if signature is None:
+                FileHandler._cache[filename] = (FileHandler._signature(filename), tasks, records)
+
     @staticmethod
     def ensure_folder_exists():
         if not os.path.exists(DATA_FOLDER):
             os.makedirs(DATA_FOLDER)
 
     @staticmethod
-    def load_tasks(filename):
+    def _snapshot(tasks):
+        # Copy each task so callers mutating their list can't corrupt the cache
+        return [dict(task) for task in tasks]
+
+    @staticmethod
+    def _encode(record):
+        if FileHandler.pretty:
+            return (json.dumps(record) + "\n").encode()
+        if orjson:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+
+        # The log only ever holds these two shapes, so format them directly and
+        # leave json to escape the strings; anything else goes through json.dumps
+        keys = record.keys()
+        if keys == FileHandler._TASK_KEYS:
+            return (
+                f'{{"taskid":{record["taskid"]:d},"taskname":{json.dumps(record["taskname"])},'
+                f'"description":{json.dumps(record["description"])},"rev":{record["rev"]:d}}}\n'
+            ).encode()
+        if keys == FileHandler._TOMBSTONE_KEYS and record["deleted"] is True:
+            return f'{{"taskid":{record["taskid"]:d},"deleted":true,"rev":{record["rev"]:d}}}\n'.encode()
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+    @staticmethod
+    def _decode(line):
+        return orjson.loads(line) if orjson else json.loads(line)
+
+    @staticmethod
+    def _status_file(filename):
+        # Packed status column: byte N holds the status code of task ID N
+        return os.path.splitext(filename)[0] + "_status.bin"
+
+    @staticmethod
+    def _pack_status(status):
+        # Returns the status byte, or None if the status can't be packed and must stay in the log
+        if status is None:
+            return FileHandler.NO_STATUS
+        if isinstance(status, int) and 0 <= status <= 127:
+            return status
+        return None
+
+    @staticmethod
+    def _log_record(task):
+        # Everything but the status goes in the log
+        record = {key: value for key, value in task.items() if key != "status"}
+        if FileHandler._pack_status(task.get("status")) is None:
+            record["status"] = task["status"]
+        return record
+
+    @staticmethod
+    def _read_statuses(filename):
+        statuses = array("b")
+        try:
+            with open(FileHandler._status_file(filename), "rb") as file:
+                statuses.frombytes(file.read())
+        except FileNotFoundError:
+            pass
+        return statuses
+
+    @staticmethod
+    def _write_statuses(filename, updates):
+        # Overwrite single status bytes in place, padding any gap with "no status"
+        path = FileHandler._status_file(filename)
+        try:
+            file = open(path, "r+b")
+        except FileNotFoundError:
+            file = open(path, "w+b")
+        with file:
+            size = file.seek(0, os.SEEK_END)
+            for taskid, status in sorted(dict(updates).items()):  # Last update per task wins
+                if taskid > size:
+                    file.seek(size)
+                    file.write(bytes([FileHandler.NO_STATUS & 0xFF]) * (taskid - size))
+                file.seek(taskid)
+                file.write(bytes([status & 0xFF]))
+                size = max(size, taskid + 1)
+
+    @staticmethod
+    def _atomic_write(path, data):
+        # Write a sibling temp file and swap it in, so a crash never leaves a truncated file
+        # Created 0666 so the kernel applies the umask, just like open() would for a new file
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        while True:
+            tmp = os.path.join(os.path.dirname(path) or ".", f".tasks.{os.urandom(8).hex()}.tmp")
+            try:
+                fd = os.open(tmp, flags, 0o666)
+                break
+            except FileExistsError:
+                continue
+        try:
+            try:
+                os.chmod(tmp, os.stat(path).st_mode & 0o777)  # Keep an existing target's mode
+            except FileNotFoundError:
+                pass
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @staticmethod
+    def _terminate_tail(filename, data):
+        # An interrupted append can leave a torn last line; start new records on a fresh line
+        # so they aren't glued onto it and skipped along with it
+        try:
+            with open(filename, "rb") as file:
+                if file.seek(0, os.SEEK_END) == 0:
+                    return data
+                file.seek(-1, os.SEEK_END)
+                last = file.read(1)
+        except FileNotFoundError:
+            return data
+        return data if last == b"\n" else b"\n" + data
+
+    @staticmethod
+    def _read_log(filename):
+        # Fold the log by task ID, keeping the record with the highest rev
+        latest = {}
+        records = 0
+        with open(filename, "rb", buffering=FileHandler.BUFFER_SIZE) as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    record = FileHandler._decode(line)
+                except ValueError:
+                    continue  # Skip a torn trailing line from an interrupted append
+                records += 1
+                current = latest.get(record["taskid"])
+                if current is None or record["rev"] > current["rev"]:
+                    latest[record["taskid"]] = record
+
+        statuses = FileHandler._read_statuses(filename)
+        tasks = {}
+        for taskid, record in latest.items():
+            if not record.get("deleted"):
+                task = dict(record)
+                del task["rev"]
+                packed = statuses[taskid] if 0 <= taskid < len(statuses) else FileHandler.NO_STATUS
+                if packed != FileHandler.NO_STATUS:
+                    task["status"] = packed
+                else:
+                    task.setdefault("status", None)  # Logs written before the status file kept it inline
+                tasks[taskid] = task
+        return tasks, records
+
+    @staticmethod
+    def _signature(filename):
+        # Size catches appends that land within the filesystem's mtime granularity
+        st = os.stat(filename)
+        try:
+            status_st = os.stat(FileHandler._status_file(filename))
+            status_signature = (status_st.st_mtime_ns, status_st.st_size)
+        except FileNotFoundError:
+            status_signature = None
+        return st.st_mtime_ns, st.st_size, status_signature
+
+    @staticmethod
+    def _load_state(filename):
         FileHandler.ensure_folder_exists()  # Ensure folder exists before accessing the file
-        if not os.path.exists(filename):
-            return []
+        cached = FileHandler._cache.get(filename)
+        if cached and cached[0] is None:
+            return cached  # Our own writes are still queued, so the cache is ahead of the file
+
         try:
-            with open(filename, "r") as file:
-                tasks = json.load(file)
-                return tasks if isinstance(tasks, list) else []
-        except (json.JSONDecodeError, ValueError):
-            return []
+            signature = FileHandler._signature(filename)
+        except FileNotFoundError:
+            return FileHandler._migrate_legacy(filename)
+
+        if cached and cached[0] == signature:
+            return cached  # File unchanged since last load/write, serve from memory
+
+        tasks, records = FileHandler._read_log(filename)
+        FileHandler._cache[filename] = (signature, tasks, records)
+        return FileHandler._cache[filename]
+
+    @staticmethod
+    def _migrate_legacy(filename):
+        # Convert a pre-JSONL tasks.json (one JSON list) sitting next to the log
+        legacy = os.path.splitext(filename)[0] + ".json"
+        tasks = []
+        if os.path.exists(legacy):
+            try:
+                with open(legacy, "r") as file:
+                    tasks = json.load(file)
+            except (json.JSONDecodeError, ValueError):
+                tasks = []
+            tasks = tasks if isinstance(tasks, list) else []
+        if not tasks:
+            return None, {}, 0
+        FileHandler.save_tasks(filename, tasks)
+        return FileHandler._cache[filename]
+
+    @staticmethod
+    def load_tasks(filename):
+        _, tasks, _ = FileHandler._load_state(filename)
+        return FileHandler._snapshot(tasks.values())
 
     @staticmethod
     def save_tasks(filename, tasks):
+        # Rewrite the log with one record per live task, and the status file to match
         FileHandler.ensure_folder_exists()  # Ensure folder exists before writing
-        with open(filename, "w") as file:
-            json.dump(tasks, file, indent=4)
+        if FileHandler._writer:
+            FileHandler._writer.drain()  # Queued writes must land before the files are replaced
+
+        statuses = array("b", [FileHandler.NO_STATUS]) * (max((task["taskid"] for task in tasks), default=-1) + 1)
+        for task in tasks:
+            packed = FileHandler._pack_status(task.get("status"))
+            if packed is not None:
+                statuses[task["taskid"]] = packed
+        FileHandler._atomic_write(FileHandler._status_file(filename), statuses.tobytes())
+        FileHandler._atomic_write(filename, b"".join(
+            FileHandler._encode({**FileHandler._log_record(task), "rev": rev}) for rev, task in enumerate(tasks, start=1)
+        ))
+        tasks = {task["taskid"]: task for task in FileHandler._snapshot(tasks)}
+        FileHandler._cache[filename] = (FileHandler._signature(filename), tasks, len(tasks))
+
+    @staticmethod
+    def append_records(filename, records):
+        # Append changed tasks (or tombstones) to the log in a single write. A task
+        # whose only change is its status costs one byte in the status file instead.
+        if not records:
+            return
+        _, tasks, rev = FileHandler._load_state(filename)
+        lines = []
+        status_updates = []
+        for record in records:
+            taskid = record["taskid"]
+            if record.get("deleted"):
+                rev += 1
+                lines.append(FileHandler._encode({**record, "rev": rev}))
+                tasks.pop(taskid, None)
+                continue
+
+            current = tasks.get(taskid)
+            log_record = FileHandler._log_record(record)
+            logged = current is None or FileHandler._log_record(current) != log_record
+            if logged:
+                rev += 1
+                lines.append(FileHandler._encode({**log_record, "rev": rev}))
+            # New IDs may reuse a deleted task's slot, so their byte is always written
+            packed = FileHandler._pack_status(record.get("status"))
+            if packed is not None and (logged or current.get("status") != record.get("status")):
+                status_updates.append((taskid, packed))
+            tasks[taskid] = dict(record)
+
+        if FileHandler._writer:
+            with FileHandler._writer.lock:
+                if lines:
+                    FileHandler._writer.submit(filename, b"".join(lines))
+                if status_updates:
+                    FileHandler._writer.submit_statuses(filename, status_updates)
+                FileHandler._cache[filename] = (None, tasks, rev)
+        else:
+            if status_updates:
+                FileHandler._write_statuses(filename, status_updates)  # Before the log; see BackgroundWriter._run
+            if lines:
+                data = FileHandler._terminate_tail(filename, b"".join(lines))
+                with open(filename, "ab", buffering=FileHandler.BUFFER_SIZE) as file:
+                    file.write(data)
+            FileHandler._cache[filename] = (FileHandler._signature(filename), tasks, rev)
+
+        if rev > FileHandler.COMPACT_RATIO * max(len(tasks), 1):
+            FileHandler.save_tasks(filename, list(tasks.values()))
+
+    @staticmethod
+    def tombstone(task_id):
+        # Log record marking a task as deleted
+        return {"taskid": task_id, "deleted": True}
+
+
+class TablePrinter:
+    # Draw tables with tabulate's grid format instead of streaming them (set by --pretty)
+    pretty = False
+
+    @staticmethod
+    def print_table(rows, headers, out=None):
+        out = sys.stdout if out is None else out
+        if TablePrinter.pretty:
+            out.write(tabulate(rows, headers=headers, tablefmt="grid") + "\n")
+            return
+
+        # One pass to size the columns, then write each row as it is formatted
+        rows = [[(str(cell), TablePrinter.display_width(str(cell)), isinstance(cell, int)) for cell in row]
+                for row in rows]
+        widths = [TablePrinter.display_width(header) for header in headers]
+        for row in rows:
+            for i, (_, width, _) in enumerate(row):
+                widths[i] = max(widths[i], width)
+
+        border = "+" + "+".join("-" * (width + 2) for width in widths) + "+\n"
+        write = out.write
+        write(border)
+        write("| " + " | ".join(
+            header + " " * (width - TablePrinter.display_width(header)) for header, width in zip(headers, widths)
+        ) + " |\n")
+        write(border.replace("-", "="))
+        for row in rows:
+            write("| " + " | ".join(
+                " " * (width - cell_width) + text if numeric else text + " " * (width - cell_width)
+                for (text, cell_width, numeric), width in zip(row, widths)
+            ) + " |\n")
+        write(border)
+
+    @staticmethod
+    def display_width(text):
+        # Terminal columns taken by text: wide East Asian characters use two, combining marks none
+        if wcswidth:
+            width = wcswidth(text)
+            if width >= 0:
+                return width
+        if text.isascii():
+            return len(text)
+        return sum(
+            0 if unicodedata.combining(char) else 2 if unicodedata.east_asian_width(char) in "WF" else 1
+            for char in text
+        )
 
 
 class TaskValidator:
@@ -57,43 +569,60 @@ class TaskValidator:
     def validate_input(prompt, is_taskname=False, is_description=False):
         while True:
             value = input(prompt).strip()
+            # Both patterns reject empty input, so a valid value needs just one regex call
+            if is_taskname:
+                valid = TASKNAME_PATTERN.match(value)
+            elif is_description:
+                valid = DESCRIPTION_PATTERN.search(value)
+            else:
+                valid = value
+            if valid:
+                return value
+
             if not value:
                 print("Input cannot be empty. Please enter a valid value.")
-                continue
-
-            if is_taskname and not re.match(r"^[A-Za-z0-9 ]{1,20}$", value):
+            elif is_taskname:
                 print("Error: Task name can only contain letters, numbers, and spaces (max 20 characters).")
-                continue
-
-            if is_description and not re.search(r"[A-Za-z0-9]", value):
+            else:
                 print("Error: Description must contain at least one letter or number.")
-                continue
-            return value
 
 
 class TaskManager:
+    # Write pending changes once this many tasks have unsaved edits
+    FLUSH_THRESHOLD = 32
+
     def __init__(self, filename=TODO_FILE):
         self.filename = filename
-        self.tasks = FileHandler.load_tasks(self.filename)
-
-    def save_tasks(self):
-        FileHandler.save_tasks(self.filename, self.tasks)
+        self.tasks = TaskTable.from_dicts(FileHandler.load_tasks(self.filename))
+        # IDs only increase within a session; since this starts from the highest live ID,
+        # deleting the newest task and restarting hands its ID out again
+        self._next_id = max(self.tasks.ids, default=0) + 1
+        # Task ID -> latest unsaved record, written out together by flush()
+        self._pending = {}
+        atexit.register(self.flush)
+
+    def _mark_dirty(self, record):
+        self._pending[record["taskid"]] = record
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            FileHandler.append_records(self.filename, list(self._pending.values()))
+            self._pending.clear()
 
     def get_next_task_id(self):
-        return max([task["taskid"] for task in self.tasks], default=0) + 1
+        task_id = self._next_id
+        self._next_id += 1
+        return task_id
 
     def add_task(self):
         taskname = TaskValidator.validate_input("Task Name: ", is_taskname=True)
         description = TaskValidator.validate_input("Description: ", is_description=True)
         task_id = self.get_next_task_id()
 
-        self.tasks.append({
-            "taskid": task_id,
-            "taskname": taskname,
-            "description": description,
-             "status": None
-        })
-        self.save_tasks()
+        index = self.tasks.append(task_id, taskname, description)
+        self._mark_dirty(self.tasks.row(index))
         print(f"\nTask '{taskname}' added with Task ID {task_id}.\n")
 
     def view_all_tasks(self):
@@ -101,51 +630,55 @@ class TaskManager:
             print("\nNo tasks available.\n")
             return
 
-        print("\n Overall Task List:\n")
-        table_data = [
-            [task["taskid"], task["taskname"], task["description"], TaskStatus.get_status_name(task["status"])]
-            for task in self.tasks
-        ]
-        print(tabulate(table_data, headers=["Task ID", "Task Name", "Description", "Status"], tablefmt="grid"))
-        print("\n" + "=" * 50 + "\n")
+        # Build the whole view in memory and hand it to stdout in one write
+        buf = io.StringIO()
+        buf.write("\n Overall Task List:\n\n")
+        tasks = self.tasks
+        table_data = list(zip(tasks.ids, tasks.names, tasks.descs, map(TaskStatus.get_status_name, tasks.statuses)))
+        TablePrinter.print_table(table_data, ["Task ID", "Task Name", "Description", "Status"], buf)
+        buf.write("\n" + "=" * 50 + "\n\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
     def view_tasks_by_name(self):
         if not self.tasks:
             print("\nNo tasks available.\n")
             return
 
-        task_name_groups = {}
-        for task in self.tasks:
-            task_name_groups.setdefault(task["taskname"], []).append(task)
-
-        print("\n Tasks Grouped by Task Name:\n")
-        for taskname, tasks in task_name_groups.items():
-            print(f"🔹 Task Name: '{taskname}'")
-            table_data = [
-                [task["taskid"], task["description"], TaskStatus.get_status_name(task["status"])]
-                for task in tasks
-            ]
-            print(tabulate(table_data, headers=["Task ID", "Description", "Status"], tablefmt="grid"))
-            print("\n" + "=" * 50 + "\n")
+        tasks = self.tasks
+        buf = io.StringIO()
+        buf.write("\n Tasks Grouped by Task Name:\n\n")
+        for taskname, indices in TaskTable.groups(tasks.name_to_indices):
+            buf.write(f"🔹 Task Name: '{taskname}'\n")
+            table_data = list(zip(
+                map(tasks.ids.__getitem__, indices),
+                map(tasks.descs.__getitem__, indices),
+                map(TaskStatus.get_status_name, map(tasks.statuses.__getitem__, indices))
+            ))
+            TablePrinter.print_table(table_data, ["Task ID", "Description", "Status"], buf)
+            buf.write("\n" + "=" * 50 + "\n\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
     def view_tasks_by_status(self):
         if not self.tasks:
             print("\nNo tasks available.\n")
             return
 
-        status_groups = {}
-        for task in self.tasks:
-            status_groups.setdefault(task["status"], []).append(task)
-
-        print("\n Tasks Grouped by Status:\n")
-        for status, tasks in status_groups.items():
-            print(f"🔹 Status: '{TaskStatus.get_status_name(status)}'")
-            table_data = [
-                [task["taskid"], task["taskname"], task["description"]]
-                for task in tasks
-            ]
-            print(tabulate(table_data, headers=["Task ID", "Task Name", "Description"], tablefmt="grid"))
-            print("\n" + "=" * 50 + "\n")
+        tasks = self.tasks
+        buf = io.StringIO()
+        buf.write("\n Tasks Grouped by Status:\n\n")
+        for status, indices in TaskTable.groups(tasks.status_to_indices):
+            buf.write(f"🔹 Status: '{TaskStatus.get_status_name(status)}'\n")
+            table_data = list(zip(
+                map(tasks.ids.__getitem__, indices),
+                map(tasks.names.__getitem__, indices),
+                map(tasks.descs.__getitem__, indices)
+            ))
+            TablePrinter.print_table(table_data, ["Task ID", "Task Name", "Description"], buf)
+            buf.write("\n" + "=" * 50 + "\n\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
     def update_task(self):
         if not self.tasks:
@@ -158,18 +691,18 @@ class TaskManager:
             print("\nInvalid Task ID. Please enter a valid number.\n")
             return
 
-        task = next((t for t in self.tasks if t["taskid"] == task_id), None)
-        if not task:
+        index = self.tasks.find(task_id)
+        if index is None:
             print("\nTask ID not found.\n")
             return
 
         new_taskname = input("Enter new task name (leave empty to keep current name): ").strip()
         if new_taskname:
-            task["taskname"] = new_taskname
+            self.tasks.set_name(index, new_taskname)
 
         new_description = input("Enter new description (leave empty to keep current description): ").strip()
         if new_description:
-            task["description"] = new_description
+            self.tasks.set_description(index, new_description)
 
         print("\nSelect new status:")
         for status_code in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED]:
@@ -178,14 +711,18 @@ class TaskManager:
         try:
             new_status = int(input("Enter status code (0-2): ").strip())
             if new_status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED]:
-                task["status"] = new_status
-                self.save_tasks()
+                self.tasks.set_status(index, new_status)
+                self._mark_dirty(self.tasks.row(index))
                 print("\nTask Updated Successfully.\n")
-            else:
-                print("\nInvalid status code! Please enter 0, 1, or 2.\n")
+                return
+            print("\nInvalid status code! Please enter 0, 1, or 2.\n")
         except ValueError:
             print("\nInvalid input! Please enter a number (0-2).\n")
 
+        # The name and description were already applied above, so log them even without a new status
+        if new_taskname or new_description:
+            self._mark_dirty(self.tasks.row(index))
+
     def delete_task(self):
         if not self.tasks:
             print("\nNo tasks available to delete.\n")
@@ -197,17 +734,18 @@ class TaskManager:
             print("\nInvalid Task ID. Please enter a valid number.\n")
             return
 
-        task = next((t for t in self.tasks if t["taskid"] == task_id), None)
-        if not task:
+        index = self.tasks.find(task_id)
+        if index is None:
             print("\nTask ID not found.\n")
             return
 
-        if task["status"] != TaskStatus.COMPLETED:
+        if self.tasks.statuses[index] != TaskStatus.COMPLETED:
             print("\nTask cannot be deleted because it is not completed.\n")
             return
 
-        self.tasks.remove(task)
-        self.save_tasks()
+        self.tasks.remove(index)
+        self._mark_dirty(FileHandler.tombstone(task_id))
+        self.flush()  # Deletions are written straight away
         print(f"\nTask ID {task_id} deleted successfully.\n")
 
 
@@ -232,7 +770,17 @@ class ToDoApp:
                 print(f"{k}. {v.__name__.replace('_', ' ').title()}")
             choice = input("Enter your choice: ").strip()
             options.get(choice, lambda: print("\nInvalid choice!"))()
+            self.task_manager.flush()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="To-Do List Manager")
+    parser.add_argument("--pretty", action="store_true",
+                        help="write human-readable task records and draw tables with tabulate")
+    parser.add_argument("--async-writes", action="store_true",
+                        help="save changes on a background thread instead of blocking the menu")
+    args = parser.parse_args()
+    FileHandler.pretty = TablePrinter.pretty = args.pretty
+    if args.async_writes:
+        FileHandler.enable_async_writes()
     ToDoApp().main()